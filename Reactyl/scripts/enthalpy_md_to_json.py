@@ -1,11 +1,37 @@
 #!/usr/bin/env python3
 import argparse
+import io
 import json
+import mmap
+import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import stat
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_UNC_RE = re.compile(r"±\s*([-+]?\d+(?:\.\d+)?)")
+_UNITS_RE = re.compile(r"^[A-Za-z]+/mol$")
+_CAS_RE = re.compile(r"^\d{2,7}-\d{2}-\d$")
+_CAS_STAR_RE = re.compile(r"\d{2,7}-\d{2}-\d\*\d+")  # used with fullmatch
+
+# ASCII characters a float() literal can start with, including inf/nan spellings
+_FLOAT_START = frozenset("+-.0123456789iInN")
 
 
 def _safe_float(value: str) -> Optional[float]:
+    # Structure/unit tokens (e.g. "[H][H]", "kJ/mol") are common here; reject
+    # them up front instead of raising and catching a ValueError. Whitespace
+    # and non-ASCII leads (float() accepts Unicode digits) still go to float()
+    if not value:
+        return None
+    c0 = value[0]
+    if c0 not in _FLOAT_START and c0.isascii() and not c0.isspace():
+        return None
     try:
         return float(value)
     except Exception:
@@ -21,32 +47,41 @@ def _split_cas_and_relative(token: str) -> Tuple[Optional[str], Optional[int]]:
         except Exception:
             return cas.strip() or None, None
     # Sometimes CAS may be missing; try to detect a CAS-like pattern
-    if re.match(r"^\d{2,7}-\d{2}-\d$", token):
+    if _CAS_RE.match(token):
         return token, None
     return None, None
 
 
+# Pads every "±" with spaces so glued uncertainties split into their own token
+_PM_INJECT = str.maketrans({"±": " ± "})
+
+
 def _tokenize_loose(text: str) -> List[str]:
     # Split on any whitespace; keep tokens like "±" and numbers intact
-    raw = re.split(r"\s+", text.strip())
-    tokens: List[str] = []
-    for t in raw:
-        if not t:
-            continue
-        # Separate trailing/leading ± if glued
-        if t != "±" and "±" in t:
-            # split on the first occurrence but keep numbers
-            parts = re.split(r"(±)", t)
-            for p in parts:
-                if p is None or p == "":
-                    continue
-                tokens.append(p)
-        else:
-            tokens.append(t)
-    return tokens
+    return text.translate(_PM_INJECT).split()
+
+
+# Output fields, in emission order
+_RECORD_FIELDS = (
+    "common_name",
+    "structure",
+    "enthalpy_of_formation_0K",
+    "enthalpy_of_formation_298K",
+    "uncertainty_value",
+    "molecular_mass",
+    "molecular_mass_uncertainty",
+    "cas_rn",
+    "relative_rank",
+)
 
 
 def parse_record(line1: str, line2: str) -> Optional[Dict[str, Any]]:
+    values = _parse_values(line1, line2)
+    return dict(zip(_RECORD_FIELDS, values)) if values is not None else None
+
+
+def _parse_values(line1: str, line2: str) -> Optional[Tuple[Any, ...]]:
+    # Field values in _RECORD_FIELDS order, without building a per-record dict
     species_name = line1.strip() or None
     tokens = _tokenize_loose(line2)
     if not tokens:
@@ -90,7 +125,7 @@ def parse_record(line1: str, line2: str) -> Optional[Dict[str, Any]]:
                         uncertainty_value = val
                         idx += 1
             elif tok.startswith("±"):
-                m = re.search(r"±\s*([-+]?\d+(?:\.\d+)?)", tok)
+                m = _UNC_RE.search(tok)
                 if m:
                     uncertainty_kind = "numeric"
                     uncertainty_value = _safe_float(m.group(1))
@@ -98,7 +133,7 @@ def parse_record(line1: str, line2: str) -> Optional[Dict[str, Any]]:
 
     # Units if present (e.g., kJ/mol); only when not exact
     if uncertainty_kind != "exact" and idx < len(tokens):
-        if re.match(r"^[A-Za-z]+/mol$", tokens[idx]):
+        if _UNITS_RE.match(tokens[idx]):
             units = tokens[idx]
             idx += 1
 
@@ -115,7 +150,7 @@ def parse_record(line1: str, line2: str) -> Optional[Dict[str, Any]]:
                     molecular_mass_unc = _safe_float(tokens[idx])
                     idx += 1
             elif tokens[idx].startswith("±"):
-                m = re.search(r"±\s*([-+]?\d+(?:\.\d+)?)", tokens[idx])
+                m = _UNC_RE.search(tokens[idx])
                 if m:
                     molecular_mass_unc = _safe_float(m.group(1))
                 idx += 1
@@ -128,80 +163,119 @@ def parse_record(line1: str, line2: str) -> Optional[Dict[str, Any]]:
         if "*" in last_tok:
             cas, relative = _split_cas_and_relative(last_tok)
 
-    return {
-        "common_name": species_name,
-        "structure": structure,
-        "enthalpy_of_formation_0K": dH0,
-        "enthalpy_of_formation_298K": dH298,
-        "uncertainty_value": uncertainty_value,
-        "molecular_mass": molecular_mass,
-        "molecular_mass_uncertainty": molecular_mass_unc,
-        "cas_rn": cas,
-        "relative_rank": relative,
-    }
-
-
-def parse_file(path: str) -> List[Dict[str, Any]]:
-    records: List[Dict[str, Any]] = []
-    with open(path, "r", encoding="utf-8") as f:
-        lines = [ln.rstrip("\n") for ln in f]
-
+    return (
+        species_name,
+        structure,
+        dH0,
+        dH298,
+        uncertainty_value,
+        molecular_mass,
+        molecular_mass_unc,
+        cas,
+        relative,
+    )
+
+
+def _find_line(mm: mmap.mmap, needle: bytes, match: Callable[[str], bool]) -> Optional[Tuple[int, int]]:
+    # Byte-search for `needle` and return (start, end) offsets of the first
+    # line containing it that satisfies `match`
+    pos = mm.find(needle)
+    while pos != -1:
+        line_start = mm.rfind(b"\n", 0, pos) + 1
+        line_end = mm.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(mm)
+        if match(mm[line_start:line_end].decode("utf-8").strip()):
+            return line_start, line_end
+        pos = mm.find(needle, line_end)
+    return None
+
+
+def _iter_stream_lines(f: IO[str]) -> Iterator[str]:
+    # Inputs that cannot be mapped (pipes, /dev/stdin, process substitution)
+    # are read whole so the start markers can still be searched in order
+    lines = [ln.strip() for ln in f]
     # Prefer starting from the first species name: "Dihydrogen"
-    start = None
-    for i, ln in enumerate(lines):
-        if ln.strip() == "Dihydrogen":
-            start = i
-            break
+    start = next((i for i, ln in enumerate(lines) if ln == "Dihydrogen"), None)
     if start is None:
         # Fallback: find header and start after it
-        for i, ln in enumerate(lines):
-            if ln.strip().startswith("Species Name"):
-                start = i + 1
-                break
-    if start is None:
-        start = 0
-
-    i = start
-    while i < len(lines):
-        # Skip empties
-        while i < len(lines) and not lines[i].strip():
-            i += 1
-        if i >= len(lines):
-            break
+        start = next((i + 1 for i, ln in enumerate(lines) if ln.startswith("Species Name")), 0)
+    for line in lines[start:]:
+        if line:
+            yield line
+
+
+def _iter_lines(path: str) -> Iterator[str]:
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        mm: Optional[mmap.mmap] = None
+        if stat.S_ISREG(st.st_mode):
+            if st.st_size == 0:
+                return
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mm = None
+        if mm is None:
+            yield from _iter_stream_lines(io.TextIOWrapper(f, encoding="utf-8"))
+            return
+
+        with mm:
+            # Prefer starting from the first species name: "Dihydrogen"
+            start = 0
+            found = _find_line(mm, b"Dihydrogen", lambda ln: ln == "Dihydrogen")
+            if found is not None:
+                start = found[0]
+            else:
+                # Fallback: find header and start after it
+                found = _find_line(mm, b"Species Name", lambda ln: ln.startswith("Species Name"))
+                if found is not None:
+                    # The header may be the last line, with no newline after it
+                    start = min(found[1] + 1, len(mm))
+            mm.seek(start)
+            # Each line is stripped exactly once here; blank lines never
+            # reach the parser
+            for raw in iter(mm.readline, b""):
+                line = raw.decode("utf-8").strip()
+                if line:
+                    yield line
 
-        species_name_line = lines[i].strip()
-        i += 1
-        if not species_name_line:
-            continue
 
+def parse_file(path: str) -> List[Dict[str, Any]]:
+    # Accumulated column-wise (one list per field); per-record dicts are only
+    # built once parsing is done
+    columns: List[List[Any]] = [[] for _ in _RECORD_FIELDS]
+    lines = _iter_lines(path)
+    for species_name_line in lines:
         # Accumulate following line(s) until we detect CAS*relative token
         data_lines: List[str] = []
-        cas_found = False
-        while i < len(lines):
-            next_line = lines[i].strip()
-            # If next species header detected prematurely (rare), break
-            # Heuristic: a line with no digits and not containing brackets/SMILES-like chars is likely a species name
-            if not next_line:
-                i += 1
-                continue
-            tokens = _tokenize_loose(next_line)
-            has_cas = any(("*" in t and re.match(r"^\d{2,7}-\d{2}-\d\*\d+$", t)) for t in tokens)
+        for next_line in lines:
+            # The cheap "*" check rules out most tokens before the regex runs
+            has_cas = False
+            for t in _tokenize_loose(next_line):
+                if "*" in t and _CAS_STAR_RE.fullmatch(t):
+                    has_cas = True
+                    break
             data_lines.append(next_line)
-            i += 1
             if has_cas:
-                cas_found = True
                 break
 
         data_text = " ".join(data_lines)
-        rec = parse_record(species_name_line, data_text)
-        if rec:
+        values = _parse_values(species_name_line, data_text)
+        if values is not None:
             # Replace None with empty string for all fields
-            sanitized: Dict[str, Any] = {}
-            for k, v in rec.items():
-                sanitized[k] = "" if v is None else v
-            records.append(sanitized)
+            for column, v in zip(columns, values):
+                column.append("" if v is None else v)
+
+    return [dict(zip(_RECORD_FIELDS, row)) for row in zip(*columns)]
+
 
-    return records
+if orjson is not None:
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def main() -> None:
@@ -211,8 +285,8 @@ def main() -> None:
     args = parser.parse_args()
 
     data = parse_file(args.input)
-    with open(args.output, "w", encoding="utf-8") as out:
-        json.dump(data, out, ensure_ascii=False, indent=2)
+    with open(args.output, "wb") as out:
+        out.write(_dumps(data))
 
 
 if __name__ == "__main__":
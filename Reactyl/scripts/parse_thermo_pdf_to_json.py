@@ -1,8 +1,43 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
 import json
+import os
 import re
-from typing import Any, Dict, List, Optional
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24
+    except ImportError:
+        pymupdf = None
+
+
+_NUM_ALLOWED = frozenset("0123456789+-.Ee")
+
+
+class _NumericCharFilter(dict):
+    # str.translate table that deletes every character a float literal cannot
+    # contain; entries are filled in lazily so any code point is handled
+    def __missing__(self, key: int) -> Optional[int]:
+        value = key if chr(key) in _NUM_ALLOWED else None
+        self[key] = value
+        return value
+
+
+_DEL_TABLE = _NumericCharFilter()
 
 
 def _safe_float(s: str) -> Optional[float]:
@@ -12,16 +47,24 @@ def _safe_float(s: str) -> Optional[float]:
     if not t:
         return None
     # Remove thousands separators and non-numeric trailing chars
-    t = t.replace(",", "")
-    t = re.sub(r"[^0-9+\-\.Ee]", "", t)
+    t = t.replace(",", "").translate(_DEL_TABLE)
+    # Text cells usually leave no digits behind; reject them without paying
+    # for a raised ValueError
+    if not t.strip("+-.Ee"):
+        return None
     try:
         return float(t)
-    except Exception:
+    except ValueError:
         return None
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
 def _normalize_header(cell: str) -> str:
-    return re.sub(r"\s+", " ", (cell or "").strip().lower())
+    # Cached: the same header text repeats on every page of a spanning table
+    return _WHITESPACE_RE.sub(" ", (cell or "").strip().lower())
 
 
 def _extract_with_camelot(pdf_path: str) -> List[List[List[str]]]:
@@ -46,156 +89,490 @@ def _extract_with_camelot(pdf_path: str) -> List[List[List[str]]]:
     return tables_cells
 
 
-def _extract_with_pdfplumber(pdf_path: str) -> List[List[List[str]]]:
+# Table settings tried in order of strictness
+_TABLE_STRATEGIES: List[Dict[str, str]] = [
+    {"vertical_strategy": "lines", "horizontal_strategy": "lines"},
+    {"vertical_strategy": "lines", "horizontal_strategy": "text"},
+    {"vertical_strategy": "text", "horizontal_strategy": "text"},
+]
+
+
+def _count_pages(pdf_path: str) -> int:
+    import pdfplumber
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _map_pages(worker, pdf_path: str, page_numbers: range, threads: int) -> List[Any]:
+    # Pages are independent and parsing them is CPU-bound inside pdfminer, so fan
+    # them out across processes; executor.map keeps results in page order
+    if threads <= 1 or len(page_numbers) <= 1:
+        return [worker(pdf_path, page_no) for page_no in page_numbers]
+    with ProcessPoolExecutor(max_workers=min(threads, len(page_numbers))) as executor:
+        return list(executor.map(worker, repeat(pdf_path), page_numbers))
+
+
+# Pages probed in-process for a winning table strategy before fanning out
+_DISCOVERY_PAGES = 3
+
+
+def _strategy_order(preferred: Optional[int]) -> List[Dict[str, str]]:
+    if preferred is None or not 0 <= preferred < len(_TABLE_STRATEGIES):
+        return _TABLE_STRATEGIES
+    return [_TABLE_STRATEGIES[preferred]] + [
+        ts for i, ts in enumerate(_TABLE_STRATEGIES) if i != preferred
+    ]
+
+
+def _extract_page(
+    pdf_path: str, page_no: int, strategies: List[Dict[str, str]] = _TABLE_STRATEGIES
+) -> Tuple[List[List[List[str]]], Optional[int]]:
+    # Returns the page's tables and the _TABLE_STRATEGIES index that found them
+    import pdfplumber
+
+    tables_cells: List[List[List[str]]] = []
+    winner: Optional[int] = None
+    # Only lay out the assigned page
+    with pdfplumber.open(pdf_path, pages=[page_no]) as pdf:
+        page = pdf.pages[0]
+        page_tables: List[List[List[str]]] = []
+        for ts in strategies:
+            try:
+                page_tables = page.extract_tables(table_settings=ts)
+            except Exception:
+                page_tables = []
+            if page_tables:
+                winner = _TABLE_STRATEGIES.index(ts)
+                break
+        # Drop the page's cached chars/objects before normalizing the tables
+        page.flush_cache()
+        for tbl in page_tables or []:
+            if not tbl:
+                continue
+            normalized = [[(c if c is not None else "") for c in row] for row in tbl]
+            tables_cells.append(normalized)
+    return tables_cells, winner
+
+
+def _extract_with_pdfplumber(
+    pdf_path: str, threads: int = 1, strategy: Optional[int] = None
+) -> Tuple[List[List[List[str]]], Optional[int]]:
+    # Returns the tables and the strategy locked in for this document
     try:
         import pdfplumber
     except Exception:
-        return []
+        return [], strategy
 
     tables_cells: List[List[List[str]]] = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_tables: List[List[List[str]]] = []
-            # Try multiple strategies in order of strictness
-            strategies = [
-                {"vertical_strategy": "lines", "horizontal_strategy": "lines"},
-                {"vertical_strategy": "lines", "horizontal_strategy": "text"},
-                {"vertical_strategy": "text", "horizontal_strategy": "text"},
-            ]
-            for ts in strategies:
-                try:
-                    page_tables = page.extract_tables(table_settings=ts)
-                except Exception:
-                    page_tables = []
-                if page_tables:
-                    break
-            for tbl in page_tables or []:
-                if not tbl:
-                    continue
-                normalized = [[(c if c is not None else "") for c in row] for row in tbl]
-                tables_cells.append(normalized)
-    return tables_cells
+    n_pages = _count_pages(pdf_path)
+    next_page = 1
+    if strategy is None:
+        # Discover the winning strategy on the first page that has tables,
+        # then try it first on every remaining page. Discovery runs serially,
+        # so it is capped to a short prefix; table-less documents still get
+        # the rest of their pages through the process pool.
+        while next_page <= min(n_pages, _DISCOVERY_PAGES) and strategy is None:
+            page_tables, strategy = _extract_page(pdf_path, next_page)
+            tables_cells.extend(page_tables)
+            next_page += 1
+
+    worker = partial(_extract_page, strategies=_strategy_order(strategy))
+    for page_tables, _ in _map_pages(worker, pdf_path, range(next_page, n_pages + 1), threads):
+        tables_cells.extend(page_tables)
+    return tables_cells, strategy
+
+
+# Substrings that identify each expected column in a normalized header cell
+_HEADER_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "formula": ("formula",),
+    "state": ("state",),
+    "enthalpy": ("enthalpy",),
+    "entropy": ("entropy",),
+    "gibbs": ("gibbs", "free energy"),
+}
+# Header cells that only count when they match exactly
+_HEADER_EXACT: Dict[str, str] = {"species": "formula", "name": "formula"}
 
 
 def _find_columns(header: List[str]) -> Dict[str, int]:
     # Return indices for the expected columns
-    cols = {"formula": -1, "state": -1, "enthalpy": -1, "entropy": -1, "gibbs": -1}
-    norm = [_normalize_header(h) for h in header]
-    for i, h in enumerate(norm):
-        if cols["formula"] == -1 and ("formula" in h or h == "species" or h == "name"):
-            cols["formula"] = i
-        if cols["state"] == -1 and ("state of matter" in h or h == "state" or "state" in h):
-            cols["state"] = i
-        if cols["enthalpy"] == -1 and ("enthalpy" in h):
-            cols["enthalpy"] = i
-        if cols["entropy"] == -1 and ("entropy" in h):
-            cols["entropy"] = i
-        if cols["gibbs"] == -1 and ("gibbs" in h or "free energy" in h):
-            cols["gibbs"] = i
+    return dict(_classify_header(tuple(header)))
+
+
+@lru_cache(maxsize=256)
+def _classify_header(header: Tuple[str, ...]) -> Dict[str, int]:
+    # Cached on the whole header row: spanning tables repeat it on every page
+    cols = dict.fromkeys(_HEADER_KEYWORDS, -1)
+    pending = dict(_HEADER_KEYWORDS)
+    for i, cell in enumerate(header):
+        h = _normalize_header(cell)
+        exact_field = _HEADER_EXACT.get(h)
+        for field, keywords in list(pending.items()):
+            if field == exact_field or any(k in h for k in keywords):
+                cols[field] = i
+                del pending[field]
+        if not pending:
+            break
     return cols
 
 
-def _rows_to_records(table: List[List[str]]) -> List[Dict[str, Any]]:
+# State-of-matter cell values mapped to the schema's phase names
+_PHASE_MAP: Dict[str, str] = {
+    "(g)": "gas", "g": "gas", "gas": "gas",
+    "(l)": "liquid", "l": "liquid", "liquid": "liquid",
+    "(s)": "solid", "s": "solid", "solid": "solid",
+}
+
+
+# Records are accumulated column-wise (one list per populated field) and only
+# turned into per-record dicts when the output is written
+_COLUMN_FIELDS = (
+    "structure",
+    "enthalpy_of_formation_298K",
+    "entropy_298K",
+    "gibbs_free_energy_298K",
+    "phase",
+)
+
+
+def _new_columns() -> Dict[str, List[Any]]:
+    return {field: [] for field in _COLUMN_FIELDS}
+
+
+def _extend_columns(columns: Dict[str, List[Any]], other: Dict[str, List[Any]]) -> None:
+    for field in _COLUMN_FIELDS:
+        columns[field].extend(other[field])
+
+
+def _iter_records(columns: Dict[str, List[Any]]) -> Iterator[Dict[str, Any]]:
+    # Records are materialized one at a time as the writer consumes them
+    return (
+        {
+            "common_name": "",  # PDF does not provide common names
+            "structure": structure,
+            "enthalpy_of_formation_0K": "",  # not provided by this PDF
+            "enthalpy_of_formation_298K": enthalpy,
+            "entropy_298K": entropy,
+            "gibbs_free_energy_298K": gibbs,
+            "phase": phase,
+            "uncertainty_value": "",
+            "molecular_mass": "",
+            "molecular_mass_uncertainty": "",
+            "cas_rn": "",
+            "relative_rank": "",
+        }
+        for structure, enthalpy, entropy, gibbs, phase in zip(*(columns[field] for field in _COLUMN_FIELDS))
+    )
+
+
+def _coerce_floats(cells: List[str]) -> List[Any]:
+    # Unparseable cells become "" as the output schema expects
+    return ["" if v is None else v for v in map(_safe_float, cells)]
+
+
+@lru_cache(maxsize=64)
+def _row_extractor(layout: Tuple[int, ...]) -> Tuple[int, List[str], itemgetter]:
+    # Rows are cut/padded to `width` cells plus one trailing blank, and missing
+    # columns point at that blank, so a single itemgetter call extracts every
+    # field without per-cell bounds checks. Cached per column layout because
+    # spanning tables repeat the same header on every page.
+    width = max(layout) + 1
+    padding = [""] * (width + 1)
+    getter = itemgetter(*(c if c >= 0 else width for c in layout))
+    return width, padding, getter
+
+
+def _rows_to_records(table: List[List[str]], columns: Dict[str, List[Any]]) -> int:
+    # Appends the table's rows to `columns`; returns the number of rows added
     if not table:
-        return []
+        return 0
     header = table[0]
     cols = _find_columns(header)
     if cols["formula"] == -1:
-        return []
+        return 0
+
+    width, padding, getter = _row_extractor(
+        (cols["formula"], cols["enthalpy"], cols["state"], cols["entropy"], cols["gibbs"])
+    )
 
-    records: List[Dict[str, Any]] = []
+    structures = columns["structure"]
+    phases = columns["phase"]
+    enthalpy_cells: List[str] = []
+    entropy_cells: List[str] = []
+    gibbs_cells: List[str] = []
     for row in table[1:]:
         if not any(cell and str(cell).strip() for cell in row):
             continue
         try:
-            formula = row[cols["formula"]] if cols["formula"] >= 0 and cols["formula"] < len(row) else ""
-            enthalpy = row[cols["enthalpy"]] if cols["enthalpy"] >= 0 and cols["enthalpy"] < len(row) else ""
-            state = row[cols["state"]] if cols["state"] >= 0 and cols["state"] < len(row) else ""
-            entropy = row[cols["entropy"]] if cols["entropy"] >= 0 and cols["entropy"] < len(row) else ""
-            gibbs = row[cols["gibbs"]] if cols["gibbs"] >= 0 and cols["gibbs"] < len(row) else ""
-
-            enthalpy_val = _safe_float(enthalpy)
-            entropy_val = _safe_float(entropy)
-            gibbs_val = _safe_float(gibbs)
+            formula, enthalpy, state, entropy, gibbs = getter(row[:width] + padding[min(len(row), width):])
 
             # Normalize state to phase when possible
-            phase = ""
             st = (state or "").strip().lower()
-            if st in {"(g)", "g", "gas"}: phase = "gas"
-            elif st in {"(l)", "l", "liquid"}: phase = "liquid"
-            elif st in {"(s)", "s", "solid"}: phase = "solid"
-            elif "aq" in st: phase = "aqueous"
-
-            record = {
-                "common_name": "",  # PDF does not provide common names
-                "structure": (formula or "").strip(),
-                "enthalpy_of_formation_0K": "",  # not provided by this PDF
-                "enthalpy_of_formation_298K": enthalpy_val if enthalpy_val is not None else "",
-                "entropy_298K": entropy_val if entropy_val is not None else "",
-                "gibbs_free_energy_298K": gibbs_val if gibbs_val is not None else "",
-                "phase": phase,
-                "uncertainty_value": "",
-                "molecular_mass": "",
-                "molecular_mass_uncertainty": "",
-                "cas_rn": "",
-                "relative_rank": "",
-            }
-            records.append(record)
+            phase = _PHASE_MAP.get(st, "aqueous" if "aq" in st else "")
+
+            structure = (formula or "").strip()
         except Exception:
             # Skip malformed row
             continue
-    return records
+        structures.append(structure)
+        phases.append(phase)
+        enthalpy_cells.append(enthalpy)
+        entropy_cells.append(entropy)
+        gibbs_cells.append(gibbs)
+
+    # Numeric cells are converted a whole column at a time
+    columns["enthalpy_of_formation_298K"].extend(_coerce_floats(enthalpy_cells))
+    columns["entropy_298K"].extend(_coerce_floats(entropy_cells))
+    columns["gibbs_free_energy_298K"].extend(_coerce_floats(gibbs_cells))
+    return len(enthalpy_cells)
+
+
+# Scraped text separates columns with runs of two or more spaces
+_COLUMN_SPLIT_RE = re.compile(r"\s{2,}")
+
+
+def _scrape_lines(lines: List[str]) -> Dict[str, List[Any]]:
+    columns = _new_columns()
+    split_columns = _COLUMN_SPLIT_RE.split
+    # Heuristic: detect rows that have at least 3 whitespace-separated numeric columns after a formula token
+    for ln in lines:
+        parts = split_columns(ln.strip())
+        if len(parts) < 3:
+            continue
+        # First part likely formula; last parts may contain numbers
+        nums = [v for v in map(_safe_float, parts[1:]) if v is not None]
+        if nums:
+            nums += [""] * (3 - len(nums))
+            enthalpy, entropy, gibbs = nums[:3]
+            columns["structure"].append(parts[0])
+            columns["enthalpy_of_formation_298K"].append(enthalpy)
+            columns["entropy_298K"].append(entropy)
+            columns["gibbs_free_energy_298K"].append(gibbs)
+            columns["phase"].append("")
+    return columns
+
+
+def _page_text(pdf_path: str, page_no: int) -> str:
+    # The scrape only needs plain lines, so prefer PyMuPDF's C text extractor
+    # over pdfplumber's character-level layout analysis when it is installed
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.load_page(page_no - 1).get_text("text") or ""
+
+    import pdfplumber
+    with pdfplumber.open(pdf_path, pages=[page_no]) as pdf:
+        return pdf.pages[0].extract_text() or ""
+
+
+def _count_text_pages(pdf_path: str) -> int:
+    # Keeps the scrape independent of pdfplumber when PyMuPDF is the backend
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    return _count_pages(pdf_path)
+
+
+def _scrape_page(pdf_path: str, page_no: int) -> Dict[str, List[Any]]:
+    text = _page_text(pdf_path, page_no)
+    lines = [ln for ln in text.splitlines() if ln.strip()]
+    return _scrape_lines(lines)
 
 
-def parse_pdf_to_json(pdf_path: str) -> (List[Dict[str, Any]], List[str]):
+def _parse_columns(
+    pdf_path: str, threads: int, strategy: Optional[int] = None
+) -> Tuple[Dict[str, List[Any]], List[str], Optional[int]]:
     logs: List[str] = []
     # Try Camelot first
     tables = _extract_with_camelot(pdf_path)
     logs.append(f"camelot_tables={len(tables)}")
     if not tables:
-        tables = _extract_with_pdfplumber(pdf_path)
+        tables, strategy = _extract_with_pdfplumber(pdf_path, threads, strategy)
         logs.append(f"pdfplumber_tables={len(tables)}")
 
-    all_records: List[Dict[str, Any]] = []
+    columns = _new_columns()
+    n_records = 0
     for tbl in tables:
-        recs = _rows_to_records(tbl)
-        all_records.extend(recs)
-    logs.append(f"records_after_tables={len(all_records)}")
+        n_records += _rows_to_records(tbl, columns)
+    logs.append(f"records_after_tables={n_records}")
     # If still empty, attempt a basic text scrape as a last resort
-    if not all_records:
+    if not n_records:
         try:
-            import pdfplumber
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    lines = [ln for ln in text.splitlines() if ln.strip()]
-                    # Heuristic: detect rows that have at least 3 whitespace-separated numeric columns after a formula token
-                    for ln in lines:
-                        parts = re.split(r"\s{2,}", ln.strip())
-                        if len(parts) < 3:
-                            continue
-                        # First part likely formula; last parts may contain numbers
-                        nums = [p for p in parts[1:] if _safe_float(p) is not None]
-                        if len(nums) >= 1:
-                            record = {
-                                "common_name": "",
-                                "structure": parts[0],
-                                "phase": "",
-                                "enthalpy_of_formation_0K": "",
-                                "enthalpy_of_formation_298K": _safe_float(nums[0]) or "",
-                                "entropy_298K": _safe_float(nums[1]) if len(nums) > 1 else "",
-                                "gibbs_free_energy_298K": _safe_float(nums[2]) if len(nums) > 2 else "",
-                                "uncertainty_value": "",
-                                "molecular_mass": "",
-                                "molecular_mass_uncertainty": "",
-                                "cas_rn": "",
-                                "relative_rank": "",
-                            }
-                            all_records.append(record)
-            logs.append(f"records_after_text_scrape={len(all_records)}")
+            page_numbers = range(1, _count_text_pages(pdf_path) + 1)
+            for page_columns in _map_pages(_scrape_page, pdf_path, page_numbers, threads):
+                _extend_columns(columns, page_columns)
+            logs.append(f"records_after_text_scrape={len(columns['structure'])}")
         except Exception:
             logs.append("text_scrape_failed")
-    return all_records, logs
+    return columns, logs, strategy
+
+
+_CACHE_INDEX = "index.json"
+# Bump whenever parsing or the output schema changes so older cache entries
+# are treated as misses instead of masking the change
+_PARSER_VERSION = 2
+
+
+def _file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    # A unique temp file per writer keeps concurrent runs sharing a cache dir
+    # from clobbering each other's partial output
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_index(cache_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(cache_dir, _CACHE_INDEX), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except Exception:
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _index_entry(index: Dict[str, Any], pdf_path: str, key: str) -> Optional[Dict[str, Any]]:
+    entry = index.get(os.path.realpath(pdf_path))
+    if isinstance(entry, dict) and entry.get("sha1") == key:
+        return entry
+    return None
+
+
+def _cache_key(pdf_path: str, cache_dir: str) -> str:
+    # The index remembers each PDF's size/mtime alongside its hash, so an
+    # unchanged file is recognised without re-reading it
+    st = os.stat(pdf_path)
+    index = _load_index(cache_dir)
+    real_path = os.path.realpath(pdf_path)
+    entry = index.get(real_path)
+    if (
+        isinstance(entry, dict)
+        and isinstance(entry.get("sha1"), str)
+        and entry.get("size") == st.st_size
+        and entry.get("mtime_ns") == st.st_mtime_ns
+    ):
+        return entry["sha1"]
+
+    key = _file_sha1(pdf_path)
+    index[real_path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha1": key}
+    try:
+        _write_json_atomic(os.path.join(cache_dir, _CACHE_INDEX), index)
+    except Exception:
+        pass
+    return key
+
+
+def _remember_strategy(cache_dir: str, pdf_path: str, key: str, strategy: Optional[int]) -> None:
+    # Stored on the index entry rather than the result payload so that runs
+    # which miss the result cache (parser version bump, skipped degraded
+    # parse, unreadable payload) can still skip strategy discovery
+    index = _load_index(cache_dir)
+    entry = _index_entry(index, pdf_path, key)
+    if entry is None or entry.get("table_strategy") == strategy:
+        return
+    entry["table_strategy"] = strategy
+    try:
+        _write_json_atomic(os.path.join(cache_dir, _CACHE_INDEX), index)
+    except Exception:
+        pass
+
+
+def parse_pdf_to_json(
+    pdf_path: str, threads: int = 1, cache_dir: Optional[str] = None, force_refresh: bool = False
+) -> (Iterator[Dict[str, Any]], List[str]):
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            key = _cache_key(pdf_path, cache_dir)
+        except Exception:
+            # An unusable cache dir degrades to a normal, uncached parse
+            cache_dir = None
+    if not cache_dir:
+        columns, logs, _ = _parse_columns(pdf_path, threads)
+        return _iter_records(columns), logs
+
+    cache_path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except Exception:
+        cached = {}
+    if not isinstance(cached, dict) or cached.get("parser_version") != _PARSER_VERSION:
+        cached = {}
+    if not force_refresh and "columns" in cached and "logs" in cached:
+        return _iter_records(cached["columns"]), ["cache_hit"] + cached["logs"]
+
+    # Reuse the table strategy a previous run locked in, except on --refresh,
+    # which must reproduce a cold parse
+    strategy: Optional[int] = None
+    if not force_refresh:
+        entry = _index_entry(_load_index(cache_dir), pdf_path, key)
+        if entry is not None and isinstance(entry.get("table_strategy"), int):
+            strategy = entry["table_strategy"]
+    reused = strategy is not None
+    columns, logs, strategy = _parse_columns(pdf_path, threads, strategy)
+    if reused:
+        logs.insert(0, f"table_strategy_reused={strategy}")
+    if strategy is not None:
+        _remember_strategy(cache_dir, pdf_path, key, strategy)
+    # A degraded parse (missing backend, failed scrape, broken pool) must not
+    # become a permanent hit; only cache runs that produced records
+    if "text_scrape_failed" in logs or not columns["structure"]:
+        logs.append("cache_skip")
+        return _iter_records(columns), logs
+    try:
+        _write_json_atomic(cache_path, {
+            "parser_version": _PARSER_VERSION,
+            "columns": columns,
+            "logs": logs,
+        })
+        logs.append(f"cache_write={key}")
+    except Exception:
+        logs.append("cache_write_failed")
+    return _iter_records(columns), logs
+
+
+# stdlib json drops to its pure-Python encoder whenever indent is set, so
+# prefer orjson's C encoder when it is installed
+if orjson is not None:
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    # One shared encoder; json.dumps builds a new one per call when given options
+    _JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+    def _dumps(data: Any) -> bytes:
+        return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+def _write_json_array(path: str, records: Iterator[Dict[str, Any]]) -> None:
+    # Stream the array one record at a time, laid out exactly like an indent=2
+    # dump of the whole list, so the full output never sits in memory at once.
+    # Newlines inside string values are escaped, so re-indenting each record's
+    # serialized lines is safe.
+    dumps = _dumps  # encoder resolved once, outside the per-record loop
+    with open(path, "wb") as f:
+        f.write(b"[")
+        first = True
+        for record in records:
+            f.write(b"\n  " if first else b",\n  ")
+            f.write(dumps(record).replace(b"\n", b"\n  "))
+            first = False
+        f.write(b"]" if first else b"\n]")
 
 
 def main() -> None:
@@ -204,14 +581,20 @@ def main() -> None:
     parser.add_argument("output_json", help="Path to write JSON output")
     parser.add_argument("-v", "--verbose", action="store_true", help="Print debug info to stdout")
     parser.add_argument("-d", "--debug", action="store_true", help="Print first few lines of each page for debugging")
+    parser.add_argument(
+        "-t", "--threads", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes used to parse pages (default: CPU count)",
+    )
+    parser.add_argument("--cache-dir", help="Reuse parsed results stored here, keyed by the PDF's SHA-1")
+    parser.add_argument("--refresh", action="store_true", help="Ignore any cached result and re-parse the PDF")
     args = parser.parse_args()
 
-    data, logs = parse_pdf_to_json(args.input_pdf)
+    data, logs = parse_pdf_to_json(args.input_pdf, args.threads, args.cache_dir, args.refresh)
     if args.debug:
         try:
             import pdfplumber
-            with pdfplumber.open(args.input_pdf) as pdf:
-                for i, page in enumerate(pdf.pages[:3]):  # First 3 pages
+            with pdfplumber.open(args.input_pdf, pages=[1, 2, 3]) as pdf:
+                for i, page in enumerate(pdf.pages):  # First 3 pages
                     text = page.extract_text() or ""
                     lines = [ln.strip() for ln in text.splitlines() if ln.strip()][:10]  # First 10 lines
                     print(f"=== PAGE {i+1} ===")
@@ -220,8 +603,7 @@ def main() -> None:
                     print()
         except Exception as e:
             print(f"Debug failed: {e}")
-    with open(args.output_json, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _write_json_array(args.output_json, data)
     if args.verbose:
         print("; ".join(logs))
 